@@ -5,17 +5,32 @@ Uses Zyte API to bypass Cloudflare protection.
 """
 
 import os
+import hashlib
+import html
 import smtplib
 import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Set, List, Dict
+from string import Template
+from typing import Callable, Iterator, Set, List, Dict, Optional, Tuple
 import logging
 import requests
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+
+try:
+    # orjson decodes the large browserHtml string in Zyte responses several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Configure logging
 logging.basicConfig(
@@ -33,12 +48,23 @@ EMAIL_APP_PASSWORD = os.environ.get("EMAIL_APP_PASSWORD")
 ZYTE_API_KEY = os.environ.get("ZYTE_API_KEY")
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
+EMAIL_DIGEST_THRESHOLD = 3  # With more new listings than this, send one digest email instead of one each
+MAX_CONCURRENT_FETCHES = 4  # Zyte renders in parallel; cap how many we keep in flight
+ZYTE_REQUESTS_PER_SECOND = 5  # Stay under Zyte's rate limit instead of bursting into 429s
+ZYTE_MAX_ATTEMPTS = 3
+ZYTE_RETRY_BACKOFF = 0.5  # Seconds, doubled after every failed attempt
+ZYTE_RETRY_STATUS_CODES = {429, 503}
+ZYTE_CACHE_DIR = os.environ.get("ZYTE_CACHE_DIR")  # Set while developing to reuse today's fetched pages
+ZYTE_CACHE_TTL = float(os.environ.get("ZYTE_CACHE_TTL") or 0)  # Seconds a cached page stays valid; 0 keeps it all day
 
 # Allowed Dublin areas (only these will be notified)
 ALLOWED_AREAS = ['dublin 6', 'dublin-6', 'dublin 6w', 'dublin-6w', 'dublin 7', 'dublin-7', 'dublin 8', 'dublin-8']
 
-# Daft.ie search URL - Sharing in D6, D6W, D7, D8, posted in last 3 days
-DAFT_SEARCH_URL = "https://www.daft.ie/sharing/ireland?location=dublin-7-dublin&location=dublin-6-dublin&location=dublin-6w-dublin&location=dublin-8-dublin&rentalPrice_from={min_price}&rentalPrice_to={max_price}&firstPublishDate_from=now-3d/d"
+# Daft.ie search URL - Sharing in D6, D6W, D7, D8, posted in last 3 days, newest first, one results page at a time
+DAFT_SEARCH_URL = "https://www.daft.ie/sharing/ireland?location=dublin-7-dublin&location=dublin-6-dublin&location=dublin-6w-dublin&location=dublin-8-dublin&rentalPrice_from={min_price}&rentalPrice_to={max_price}&firstPublishDate_from=now-3d/d&sort=publishDateDesc&pageSize={page_size}&from={offset}"
+DAFT_PAGE_SIZE = 20
+DAFT_MAX_PAGES = 3  # Results pages fetched per run
+RETRY_WINDOW_DAYS = 3  # Matches firstPublishDate_from above; failed listings older than this have left the results
 
 # MyHome.ie search URLs for each area
 MYHOME_SEARCH_URLS = [
@@ -48,64 +74,214 @@ MYHOME_SEARCH_URLS = [
     "https://www.myhome.ie/rentals/dublin-6w/property-to-rent?minprice={min_price}&maxprice={max_price}",
 ]
 
+# Only build tree nodes for the result containers; the rest of the page is skipped
+DAFT_RESULTS_STRAINER = SoupStrainer('ul', attrs={'data-testid': 'results'})
+# Strained parsing compares the raw class string, so match the class token rather than the whole attribute
+MYHOME_CARDS_STRAINER = SoupStrainer('div', class_=lambda classes: classes is not None and 'property-card' in classes.split())
+
+# Text that first appears on the tag opening the results; everything before it is cut before parsing
+DAFT_RESULTS_MARKER = 'data-testid="results"'
+MYHOME_CARDS_MARKER = 'property-card'
+
+# CSS selectors are compiled once and reused for every page and card
+DAFT_CARD_SELECTOR = sv.compile("ul[data-testid='results'] > li")
+MYHOME_CARD_SELECTOR = sv.compile('div.property-card')
+MYHOME_ADDRESS_SELECTOR = sv.compile('.card-text')
+LINK_SELECTOR = sv.compile('a')
+
+# Regexes are compiled once rather than per card
+_PRICE_RE = re.compile(r'€[\d,]+')
+_PRICE_PER_PERIOD_RE = re.compile(r'€[\d,]+\s*per\s+\w+')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+# Joins an element's strings for a single regex pass; never occurs in page text, and no pattern can match across it
+_STRING_SEPARATOR = '\x00'
+
+# The <title> sits outside the strained subtree, so read it straight from the HTML
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_NO_RESULTS_RE = re.compile(r'\b(no|0) results\b', re.IGNORECASE)
+
+
+class RateLimiter:
+    """Thread-safe token bucket that spaces requests out to a steady rate."""
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        self.rate = requests_per_second
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+zyte_rate_limiter = RateLimiter(ZYTE_REQUESTS_PER_SECOND)
+
+# Caps Zyte calls in flight across all threads, so searches running side by side stay within the connection pool
+zyte_fetch_slots = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
+
+# One keep-alive pool for every Zyte call, so only the first request pays for the TLS handshake.
+# The adapter retries failed connections; 429/503 responses are retried in fetch_page_with_zyte()
+# so every attempt goes through the rate limiter.
+zyte_session = requests.Session()
+zyte_session.auth = (ZYTE_API_KEY, '')
+zyte_session.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_CONCURRENT_FETCHES,
+    max_retries=Retry(total=ZYTE_MAX_ATTEMPTS - 1, connect=ZYTE_MAX_ATTEMPTS - 1, read=0, status=0, other=0, backoff_factor=ZYTE_RETRY_BACKOFF)
+))
+
 
 def load_seen_listings() -> Set[str]:
     """Load the set of previously seen listing IDs from file."""
-    seen_file = Path(SEEN_LISTINGS_FILE)
-    if not seen_file.exists():
-        logger.info(f"No {SEEN_LISTINGS_FILE} found. Creating new file.")
-        seen_file.touch()
+    # One bulk read; split() also drops blank lines and any stray \r or spaces around IDs
+    try:
+        seen_ids = set(Path(SEEN_LISTINGS_FILE).read_text().split())
+    except FileNotFoundError:
+        # save_listing_ids() opens with O_CREAT, so the file appears once something is seen
+        logger.info(f"No {SEEN_LISTINGS_FILE} found. Starting with no seen listings.")
         return set()
 
-    with open(seen_file, 'r') as f:
-        seen_ids = {line.strip() for line in f if line.strip()}
-
     logger.info(f"Loaded {len(seen_ids)} previously seen listings.")
     return seen_ids
 
 
-def save_listing_id(listing_id: str) -> None:
-    """Append a new listing ID to the seen listings file."""
-    with open(SEEN_LISTINGS_FILE, 'a') as f:
-        f.write(f"{listing_id}\n")
-    logger.info(f"Saved listing ID: {listing_id}")
+def retry_marker(listing_id: str) -> str:
+    """Return the seen-file entry recording that a listing's email failed today."""
+    return f"retry_{date.today().isoformat()}_{listing_id}"
 
 
-def send_email_notification(listing: Dict) -> bool:
+def pending_retries(seen_listings: Set[str]) -> Set[str]:
     """
-    Send an email notification for a new listing.
+    Find listings whose email failed recently and has not been sent since.
 
     Args:
-        listing: Dictionary containing listing details
+        seen_listings: Entries from load_seen_listings()
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        Set of listing IDs still waiting for a retry within RETRY_WINDOW_DAYS
     """
-    if not EMAIL_ADDRESS or not EMAIL_APP_PASSWORD:
-        logger.error("Email credentials not found in environment variables!")
-        return False
+    cutoff = (date.today() - timedelta(days=RETRY_WINDOW_DAYS)).isoformat()
+    pending = set()
+
+    for entry in seen_listings:
+        if entry.startswith('retry_'):
+            failed_on, _, listing_id = entry[len('retry_'):].partition('_')
+            # MyHome has no paging to widen, every run already scans all of it
+            if failed_on >= cutoff and listing_id not in seen_listings and not listing_id.startswith('myhome_'):
+                pending.add(listing_id)
+
+    return pending
+
+
+def rescan_marker() -> str:
+    """Return the seen-file entry recording that today's Daft.ie scan missed pages."""
+    return f"rescan_{date.today().isoformat()}"
+
+
+def pending_rescans(seen_listings: Set[str]) -> Set[str]:
+    """
+    Find markers left by Daft.ie scans that missed pages, cleared by the next complete scan.
+
+    Args:
+        seen_listings: Entries from load_seen_listings()
+
+    Returns:
+        Set of rescan_ entries
+    """
+    return {entry for entry in seen_listings if entry.startswith('rescan_')}
+
+
+def expired_markers(seen_listings: Set[str]) -> Set[str]:
+    """
+    Find retry markers older than RETRY_WINDOW_DAYS, which no longer affect paging.
+
+    Args:
+        seen_listings: Entries from load_seen_listings()
+
+    Returns:
+        Set of retry_ entries to drop from the seen listings file
+    """
+    cutoff = (date.today() - timedelta(days=RETRY_WINDOW_DAYS)).isoformat()
+    return {
+        entry for entry in seen_listings
+        if entry.startswith('retry_') and entry[len('retry_'):].partition('_')[0] < cutoff
+    }
+
 
+def write_and_sync(path: str, flags: int, data: bytes) -> None:
+    """Write all of data to path, opened with the given flags, and fsync it."""
+    fd = os.open(path, os.O_WRONLY | flags, 0o644)
     try:
-        # Create message
-        msg = MIMEMultipart('alternative')
-        msg['From'] = EMAIL_ADDRESS
-        msg['To'] = EMAIL_ADDRESS
-        msg['Subject'] = f"🏠 New Room: €{listing['price']} - {listing['address']}"
-
-        # HTML email body
-        html_body = f"""
+        while data:
+            data = data[os.write(fd, data):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def save_listing_ids(entries: List[str], dropped: Set[str] = frozenset()) -> None:
+    """
+    Append new entries to the seen listings file in a single write and fsync.
+
+    Args:
+        entries: Listing IDs, plus the sig_ fingerprints and retry_/rescan_ markers stored alongside them
+        dropped: Markers to remove from the file, expired or cleared by a complete scan
+    """
+    if not entries and not dropped:
+        return
+
+    data = ''.join(f"{entry}\n" for entry in entries).encode()
+
+    if dropped:
+        # Rewrite the file without them, so the committed file does not keep growing;
+        # the rename means a crash leaves either the old file or the new one
+        kept = [line for line in Path(SEEN_LISTINGS_FILE).read_text().splitlines() if line.strip() not in dropped]
+        data = ''.join(f"{line}\n" for line in kept).encode() + data
+        temp_file = f"{SEEN_LISTINGS_FILE}.tmp"
+        write_and_sync(temp_file, os.O_CREAT | os.O_TRUNC, data)
+        os.replace(temp_file, SEEN_LISTINGS_FILE)
+        logger.info(f"Dropped {len(dropped)} expired or cleared markers")
+    else:
+        write_and_sync(SEEN_LISTINGS_FILE, os.O_APPEND | os.O_CREAT, data)
+
+    # Name the listings; fingerprints and retry markers are only counted
+    listing_ids = [entry for entry in entries if not entry.startswith(('sig_', 'retry_', 'rescan_'))]
+    signature_count = sum(entry.startswith('sig_') for entry in entries)
+    marker_count = len(entries) - len(listing_ids) - signature_count
+    logger.info(f"Saved {len(listing_ids)} listing IDs: {', '.join(listing_ids)}")
+    logger.info(f"Saved {signature_count} relist signatures and {marker_count} retry or rescan markers")
+
+
+# HTML body for notification emails, built once and filled in per listing
+EMAIL_HTML_TEMPLATE = Template("""
         <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <h2 style="color: #2c3e50;">New Room Available in Dublin!</h2>
 
                 <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin: 20px 0;">
-                    <p style="margin: 10px 0;"><strong>Price:</strong> <span style="color: #27ae60; font-size: 18px;">€{listing['price']}/month</span></p>
-                    <p style="margin: 10px 0;"><strong>Address:</strong> {listing['address']}</p>
-                    {f"<p style='margin: 10px 0;'><strong>Title:</strong> {listing.get('title', '')}</p>" if listing.get('title') else ""}
+                    <p style="margin: 10px 0;"><strong>Price:</strong> <span style="color: #27ae60; font-size: 18px;">€$price/month</span></p>
+                    <p style="margin: 10px 0;"><strong>Address:</strong> $address</p>
+                    $title_html
                 </div>
 
                 <div style="margin: 30px 0;">
-                    <a href="{listing['link']}"
+                    <a href="$link"
                        style="background-color: #3498db; color: white; padding: 12px 30px;
                               text-decoration: none; border-radius: 5px; display: inline-block;
                               font-weight: bold;">
@@ -117,39 +293,270 @@ def send_email_notification(listing: Dict) -> bool:
 
                 <p style="font-size: 12px; color: #7f8c8d;">
                     This is an automated notification from your Room Hunter bot.<br>
-                    Listing ID: {listing['id']}<br>
-                    Sent: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                    Listing ID: $listing_id<br>
+                    Sent: $sent_at
                 </p>
             </body>
         </html>
-        """
+        """)
+
+# HTML body for digest emails, with one table row per listing
+EMAIL_DIGEST_TEMPLATE = Template("""
+        <html>
+            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                <h2 style="color: #2c3e50;">$count New Rooms Available in Dublin!</h2>
+
+                <table style="border-collapse: collapse; width: 100%; margin: 20px 0;">
+                    <tr style="background-color: #f8f9fa; text-align: left;">
+                        <th style="padding: 10px;">Price</th>
+                        <th style="padding: 10px;">Address</th>
+                        <th style="padding: 10px;">Listing</th>
+                    </tr>
+                    $rows
+                </table>
+
+                <hr style="border: none; border-top: 1px solid #ddd; margin: 30px 0;">
+
+                <p style="font-size: 12px; color: #7f8c8d;">
+                    This is an automated notification from your Room Hunter bot.<br>
+                    Sent: $sent_at
+                </p>
+            </body>
+        </html>
+        """)
+
+EMAIL_DIGEST_ROW_TEMPLATE = Template("""
+                    <tr style="border-top: 1px solid #ddd;">
+                        <td style="padding: 10px; color: #27ae60; white-space: nowrap;">$price</td>
+                        <td style="padding: 10px;">$address</td>
+                        <td style="padding: 10px;"><a href="$link" style="color: #3498db;">$listing_id</a></td>
+                    </tr>""")
+
+
+def connect_smtp() -> Optional[smtplib.SMTP]:
+    """
+    Open and authenticate the SMTP connection used for all notifications in a run.
+
+    Returns:
+        smtplib.SMTP: Logged-in connection, or None if it could not be opened
+    """
+    if not EMAIL_ADDRESS or not EMAIL_APP_PASSWORD:
+        logger.error("Email credentials not found in environment variables!")
+        return None
+
+    server = None
+    try:
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+        server.starttls()
+        server.login(EMAIL_ADDRESS, EMAIL_APP_PASSWORD)
+        return server
+
+    except Exception as e:
+        logger.error(f"Failed to connect to SMTP server: {str(e)}")
+        if server:
+            server.close()
+        return None
+
+
+def close_smtp(server: smtplib.SMTP) -> None:
+    """Close an SMTP connection, politely if the server is still there."""
+    try:
+        server.quit()
+    except smtplib.SMTPException:
+        server.close()
+
+
+def email_title_html(listing: Dict) -> str:
+    """Render the optional title paragraph of the notification email."""
+    if not listing.get('title'):
+        return ""
+    return f"<p style='margin: 10px 0;'><strong>Title:</strong> {html.escape(listing['title'])}</p>"
 
-        msg.attach(MIMEText(html_body, 'html'))
 
-        # Send email
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_ADDRESS, EMAIL_APP_PASSWORD)
-            server.send_message(msg)
+def build_email_message(listing: Dict, sent_at: str) -> MIMEMultipart:
+    """
+    Build the notification email for a new listing.
 
-        logger.info(f"Email sent successfully for listing {listing['id']}")
-        return True
+    Args:
+        listing: Dictionary containing listing details
+        sent_at: Timestamp shown in the email footer
+
+    Returns:
+        MIMEMultipart: Message ready to send
+    """
+    msg = MIMEMultipart('alternative')
+    msg['From'] = EMAIL_ADDRESS
+    msg['To'] = EMAIL_ADDRESS
+    msg['Subject'] = f"🏠 New Room: €{listing['price']} - {listing['address']}"
+
+    # HTML email body; scraped values are escaped since addresses and titles can contain markup
+    html_body = EMAIL_HTML_TEMPLATE.substitute(
+        price=html.escape(listing['price']),
+        address=html.escape(listing['address']),
+        title_html=email_title_html(listing),
+        link=html.escape(listing['link']),
+        listing_id=html.escape(listing['id']),
+        sent_at=sent_at
+    )
+
+    msg.attach(MIMEText(html_body, 'html'))
+    return msg
+
+
+def build_digest_message(listings: List[Dict], sent_at: str) -> MIMEMultipart:
+    """
+    Build one email summarising several new listings.
+
+    Args:
+        listings: Listings to include, in the order they were found
+        sent_at: Timestamp shown in the email footer
+
+    Returns:
+        MIMEMultipart: Message ready to send
+    """
+    msg = MIMEMultipart('alternative')
+    msg['From'] = EMAIL_ADDRESS
+    msg['To'] = EMAIL_ADDRESS
+    msg['Subject'] = f"🏠 {len(listings)} New Rooms in Dublin"
+
+    rows = ''.join(
+        EMAIL_DIGEST_ROW_TEMPLATE.substitute(
+            price=html.escape(listing['price']),
+            address=html.escape(listing['address']),
+            link=html.escape(listing['link']),
+            listing_id=html.escape(listing['id'])
+        )
+        for listing in listings
+    )
+    html_body = EMAIL_DIGEST_TEMPLATE.substitute(count=len(listings), rows=rows, sent_at=sent_at)
+
+    msg.attach(MIMEText(html_body, 'html'))
+    return msg
+
+
+def send_email_notification(listings: List[Dict], server: smtplib.SMTP, sent_at: str) -> bool:
+    """
+    Send one notification email: the full details for a single listing, or a digest for several.
+
+    Args:
+        listings: Listings covered by this email
+        server: Logged-in SMTP connection from connect_smtp()
+        sent_at: Timestamp shown in the email footer
+
+    Returns:
+        bool: True if email sent successfully, False otherwise
+
+    Raises:
+        smtplib.SMTPServerDisconnected: If the connection was lost, so the caller can reconnect
+    """
+    listing_ids = ', '.join(listing['id'] for listing in listings)
+
+    try:
+        if len(listings) == 1:
+            msg = build_email_message(listings[0], sent_at)
+        else:
+            msg = build_digest_message(listings, sent_at)
+        server.send_message(msg)
+
+    except smtplib.SMTPServerDisconnected:
+        raise
 
     except Exception as e:
         logger.error(f"Failed to send email: {str(e)}")
         return False
 
+    logger.info(f"Email sent successfully for listing {listing_ids}")
+    return True
+
+
+def send_email_notifications(listings: List[Dict], sent_at: str) -> Iterator[str]:
+    """
+    Send a notification for each listing over a single SMTP connection.
+
+    When more than EMAIL_DIGEST_THRESHOLD listings arrive at once, they go
+    out together as one digest email instead. If the server drops the
+    connection part-way through, it is reopened once and the interrupted
+    message is sent again.
+
+    Args:
+        listings: Listings to notify about
+        sent_at: Timestamp shown in every email of the batch
+
+    Yields:
+        str: ID of each listing whose email was sent successfully
+    """
+    if len(listings) > EMAIL_DIGEST_THRESHOLD:
+        batches = [listings]
+    else:
+        batches = [[listing] for listing in listings]
+
+    server = connect_smtp()
+    reconnected = False
+
+    try:
+        for batch in batches:
+            sent = False
+
+            while server:
+                try:
+                    sent = send_email_notification(batch, server, sent_at)
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    server.close()
+                    server = None
+                    if not reconnected:
+                        logger.warning("SMTP connection dropped, reconnecting")
+                        reconnected = True
+                        server = connect_smtp()
+
+            for listing in batch:
+                if sent:
+                    yield listing['id']
+                else:
+                    logger.warning("Email failed for listing %s, will retry next run", listing['id'])
+    finally:
+        if server:
+            close_smtp(server)
+
+
+def zyte_cache_path(url: str) -> Optional[Path]:
+    """Return the cache file for a URL fetched today, or None if caching is disabled."""
+    if not ZYTE_CACHE_DIR:
+        return None
+
+    key = hashlib.sha256(f"{date.today().isoformat()} {url}".encode()).hexdigest()
+    return Path(ZYTE_CACHE_DIR) / f"{key}.html"
+
+
+def zyte_cache_is_fresh(cache_path: Path) -> bool:
+    """Check that a cached page exists and, when ZYTE_CACHE_TTL is set, is younger than it."""
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+    return not ZYTE_CACHE_TTL or age < ZYTE_CACHE_TTL
+
 
 def fetch_page_with_zyte(url: str) -> str:
     """
     Fetch webpage content using Zyte API.
 
+    When ZYTE_CACHE_DIR is set, pages are stored there and reused for the
+    rest of the day, or for ZYTE_CACHE_TTL seconds if that is set, instead
+    of being fetched (and billed) again.
+
     Args:
         url: The URL to fetch
 
     Returns:
         str: HTML content of the page
     """
+    cache_path = zyte_cache_path(url)
+    if cache_path and zyte_cache_is_fresh(cache_path):
+        logger.info(f"Using cached page for {url}")
+        return cache_path.read_text(encoding='utf-8')
+
     if not ZYTE_API_KEY:
         logger.error("ZYTE_API_KEY not found in environment variables!")
         raise ValueError("ZYTE_API_KEY is required")
@@ -163,15 +570,21 @@ def fetch_page_with_zyte(url: str) -> str:
 
     try:
         logger.info(f"Fetching page with Zyte API: {url}")
-        response = requests.post(
-            zyte_url,
-            json=payload,
-            auth=(ZYTE_API_KEY, ''),
-            timeout=60
-        )
+        for attempt in range(ZYTE_MAX_ATTEMPTS):
+            with zyte_fetch_slots:
+                zyte_rate_limiter.acquire()
+                response = zyte_session.post(zyte_url, json=payload, timeout=60)
+
+            if response.status_code not in ZYTE_RETRY_STATUS_CODES or attempt == ZYTE_MAX_ATTEMPTS - 1:
+                break
+
+            delay = ZYTE_RETRY_BACKOFF * 2 ** attempt
+            logger.warning(f"Zyte API returned {response.status_code}, retrying in {delay}s")
+            time.sleep(delay)
+
         response.raise_for_status()
 
-        result = response.json()
+        result = json_loads(response.content)
         html_content = result.get('browserHtml', '')
 
         if not html_content:
@@ -179,6 +592,11 @@ def fetch_page_with_zyte(url: str) -> str:
             html_content = result.get('httpResponseBody', '')
 
         logger.info(f"Successfully fetched page ({len(html_content)} characters)")
+
+        if cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(html_content, encoding='utf-8')
+
         return html_content
 
     except requests.exceptions.RequestException as e:
@@ -188,12 +606,123 @@ def fetch_page_with_zyte(url: str) -> str:
         raise
 
 
+def fetch_pages_with_zyte(urls: List[str]) -> List[Optional[str]]:
+    """
+    Fetch several webpages concurrently using Zyte API.
+
+    Each Zyte call spends almost all of its time waiting on the remote
+    browser render, so the calls are overlapped in a small thread pool.
+
+    Args:
+        urls: The URLs to fetch
+
+    Returns:
+        List of HTML contents in the same order as urls, with None for any
+        page that could not be fetched
+    """
+    def fetch(url: str) -> Optional[str]:
+        try:
+            return fetch_page_with_zyte(url)
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {str(e)}")
+            return None
+
+    if not urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FETCHES, len(urls))) as executor:
+        return list(executor.map(fetch, urls))
+
+
+def slice_from_marker(html_content: str, marker: str) -> str:
+    """
+    Drop the part of a page that comes before the tag containing marker.
+
+    Browser-rendered HTML always serializes attributes the same way, so a
+    substring search finds the results container without tokenizing the
+    head, navigation and inline scripts in front of it. If the marker is
+    missing the page is returned unchanged.
+
+    Args:
+        html_content: Full HTML of the page
+        marker: Text found inside the opening tag of the results container
+
+    Returns:
+        str: HTML starting at that tag
+    """
+    index = html_content.find(marker)
+    if index == -1:
+        return html_content
+
+    start = html_content.rfind('<', 0, index)
+    return html_content[start:] if start != -1 else html_content
+
+
 def extract_listing_id(url: str) -> str:
     """Extract listing ID from Daft.ie URL."""
-    match = re.search(r'-(\d+)/?$', url)
-    if match:
-        return match.group(1)
-    return url.split('/')[-1]
+    # Plain string splits cover the "...-<digits>" shape without running a regex per card
+    dash, digits = url.removesuffix('/').rpartition('-')[1:]
+    if dash and digits.isdigit():
+        return digits
+    return url.rpartition('/')[2]
+
+
+def in_allowed_area(link: str, address: str) -> bool:
+    """Check whether a listing's link or address mentions one of ALLOWED_AREAS."""
+    link_lower = link.lower()
+    address_lower = address.lower()
+    return any(area in link_lower or area in address_lower for area in ALLOWED_AREAS)
+
+
+def card_links(listing_cards: List[Tag], base_url: str) -> List[Tuple[Tag, str]]:
+    """
+    Pair each card with the absolute URL it links to, once per URL.
+
+    Featured blocks can repeat a listing further down the page, so only the
+    first card for each URL is kept and the repeats are never extracted.
+
+    Args:
+        listing_cards: Cards from a results page
+        base_url: Site root that relative links are resolved against
+
+    Returns:
+        List of (card, link) pairs in page order, skipping cards without a link
+    """
+    cards_by_link = {}
+
+    for card in listing_cards:
+        link_elem = LINK_SELECTOR.select_one(card)
+        link = link_elem.get('href', '') if link_elem else ''
+
+        # Make absolute URL if needed
+        if link.startswith('/'):
+            link = f"{base_url}{link}"
+
+        if link:
+            cards_by_link.setdefault(link, card)
+
+    return [(card, link) for link, card in cards_by_link.items()]
+
+
+def element_text(elem: Tag) -> str:
+    """Return an element's stripped text, skipping the recursive walk when it wraps a single string."""
+    text = elem.string
+    # Comments and other NavigableString subclasses are left to get_text(), which skips them
+    if type(text) is NavigableString:
+        return text.strip()
+    return elem.get_text(strip=True)
+
+
+def matched_string(text: str, match: re.Match) -> str:
+    """
+    Widen a match in text joined with _STRING_SEPARATOR to the whole string it fell in.
+
+    This keeps what surrounds a price in its text node, such as "/ month",
+    just as find(string=...) would return it.
+    """
+    start = text.rfind(_STRING_SEPARATOR, 0, match.start()) + 1
+    end = text.find(_STRING_SEPARATOR, match.end())
+    return text[start:end if end != -1 else len(text)].strip()
 
 
 def parse_price(price_text: str) -> str:
@@ -204,243 +733,374 @@ def parse_price(price_text: str) -> str:
     return price_text.strip().replace('\n', ' ')
 
 
-def search_daft_listings() -> List[Dict]:
+def listing_signature(listing: Dict) -> Optional[str]:
+    """
+    Fingerprint a listing by its address and price.
+
+    Relisted properties come back under a new ID, so the signature is
+    stored next to the IDs to catch repeats the ID check misses. Digits
+    are kept, since house numbers and postcodes tell rooms apart.
+
+    Args:
+        listing: Dictionary containing listing details
+
+    Returns:
+        str: sig_-prefixed digest, or None when the card had no address or price to go on
+    """
+    address = _NON_ALNUM_RE.sub(' ', listing['address'].lower()).strip()
+    price = _NON_DIGIT_RE.sub('', listing['price'])
+    if not price or address in ('', 'no title', 'no address'):
+        return None
+
+    digest = hashlib.blake2s(f"{address}|{price}".encode(), digest_size=8).hexdigest()
+    return f"sig_{digest}"
+
+
+def parse_pages(parse_page: Callable[[str], List[Dict]], urls: List[str], pages: List[Optional[str]]) -> Tuple[List[Dict], bool]:
+    """
+    Parse fetched pages into listings.
+
+    Pages are parsed one after another: strained and pre-sliced, each takes
+    a few milliseconds, far less than starting a worker process would cost.
+
+    Args:
+        parse_page: Page parser taking the HTML, e.g. a partial of parse_daft_page
+        urls: The URLs the pages were fetched from
+        pages: HTML for each URL, or None where the fetch failed
+
+    Returns:
+        List of listing dictionaries from all pages, and whether every page was fetched and parsed
+    """
+    results = []
+    complete = True
+
+    for url, html_content in zip(urls, pages):
+        if html_content is None:
+            complete = False
+            continue
+
+        try:
+            results.extend(parse_page(html_content))
+        except Exception as e:
+            logger.error(f"Error parsing page {url}: {str(e)}")
+            complete = False
+
+    return results, complete
+
+
+def select_daft_cards(html_content: str) -> List[Tag]:
+    """
+    Pick the listing cards out of one Daft.ie results page.
+
+    Args:
+        html_content: HTML of the results page
+
+    Returns:
+        List of listing card elements, including ads and other non-listing cards
+    """
+    # Parse only the results list with BeautifulSoup
+    soup = BeautifulSoup(slice_from_marker(html_content, DAFT_RESULTS_MARKER), 'lxml', parse_only=DAFT_RESULTS_STRAINER)
+
+    # Check page title for debugging
+    page_title = _TITLE_RE.search(html_content)
+    logger.info(f"Page title: {page_title.group(1).strip() if page_title else 'N/A'}")
+
+    # Check if we see "no results" message
+    if _NO_RESULTS_RE.search(html_content):
+        logger.info("Page explicitly states no results found")
+
+    # Find all listing cards using the correct selector
+    listing_cards = DAFT_CARD_SELECTOR.select(soup)
+    logger.info(f"Found {len(listing_cards)} listing cards")
+    return listing_cards
+
+
+def daft_card_links(listing_cards: List[Tag]) -> List[Tuple[Tag, str]]:
+    """
+    Pair Daft.ie cards with their listing URLs.
+
+    Args:
+        listing_cards: Cards from select_daft_cards()
+
+    Returns:
+        List of (card, link) pairs from card_links(), without ads and other non-listing cards
+    """
+    return [
+        (card, link) for card, link in card_links(listing_cards, "https://www.daft.ie")
+        if '/for-rent/' in link or '/sharing/' in link or '/share/' in link
+    ]
+
+
+def parse_daft_card(card: Tag, link: str, seen_listings: Set[str]) -> Optional[Dict]:
+    """
+    Turn one Daft.ie listing card into a listing dictionary.
+
+    Args:
+        card: Card from select_daft_cards()
+        link: Absolute listing URL from daft_card_links()
+        seen_listings: IDs already notified about, skipped before any field is extracted
+
+    Returns:
+        Listing dictionary, or None for seen listings, broken cards and cards outside allowed areas
+    """
+    try:
+        # Extract listing ID
+        listing_id = extract_listing_id(link)
+
+        # Most cards were already notified about on an earlier run, so drop them before the field lookups
+        if listing_id in seen_listings:
+            logger.debug("Skipping already seen listing %s", listing_id)
+            return None
+
+        # Index the data-testid elements in one pass rather than searching the card once per field
+        test_id_elems = {}
+        for elem in card.find_all(attrs={'data-testid': True}):
+            test_id_elems.setdefault(elem['data-testid'], elem)
+
+        # Extract title and address from card-container (need this for area check)
+        card_container = test_id_elems.get('card-container')
+        if card_container:
+            # The card-container text contains: "TH EnquiriesCoolevally, Shankill, Dublin 18 , Shan..."
+            # We need to extract the address part, so drop the "TH Enquiries" prefix if present
+            card_title = element_text(card_container).removeprefix('TH Enquiries').strip()
+        else:
+            # Fallback to headings
+            title_elem = card.find(['h2', 'h3', 'h1'])
+            card_title = element_text(title_elem) if title_elem else ""
+
+        # The card text is read once and serves as both title and address
+        title = address = card_title or "No title"
+
+        # Skip listings outside allowed areas (filter out Dublin 15, etc.)
+        if not in_allowed_area(link, address):
+            logger.debug("Skipping listing outside allowed areas: %s", address)
+            return None
+
+        # Extract price - different structure for sharing vs rental properties
+        price_text = 'N/A'
+
+        # Try subunit-card-container first (for rental properties)
+        subunit_elem = test_id_elems.get('subunit-card-container')
+        if subunit_elem:
+            price_match = subunit_elem.find(string=_PRICE_RE)
+            price_text = price_match.strip() if price_match else 'N/A'
+        else:
+            # For sharing properties, price is in card-container or as standalone element
+            # Pull the card's strings out once and search them, rather than walking them for each pattern
+            card_text = card.get_text(_STRING_SEPARATOR)
+            price_match = _PRICE_PER_PERIOD_RE.search(card_text) or _PRICE_RE.search(card_text)
+            price_text = matched_string(card_text, price_match) if price_match else 'N/A'
+
+        price = parse_price(price_text)
+
+        listing_data = {
+            'id': listing_id,
+            'price': price,
+            'address': address,
+            'title': title,
+            'link': link
+        }
+
+        logger.debug("Parsed listing: %s - %s", address, price)
+        return listing_data
+
+    except Exception as e:
+        logger.warning(f"Error processing listing card: {str(e)}")
+        return None
+
+
+def parse_daft_cards(listing_links: List[Tuple[Tag, str]], seen_listings: Set[str]) -> List[Dict]:
+    """
+    Turn Daft.ie listing cards into listing dictionaries.
+
+    Args:
+        listing_links: (card, link) pairs from daft_card_links()
+        seen_listings: IDs already notified about
+
+    Returns:
+        List of dictionaries for new listings in allowed areas
+    """
+    return [listing for listing in (parse_daft_card(card, link, seen_listings) for card, link in listing_links) if listing is not None]
+
+
+def parse_daft_page(html_content: str, seen_listings: Set[str]) -> List[Dict]:
+    """
+    Parse one Daft.ie results page.
+
+    Args:
+        html_content: HTML of the results page
+        seen_listings: IDs already notified about
+
+    Returns:
+        List of dictionaries for new listings
+    """
+    return parse_daft_cards(daft_card_links(select_daft_cards(html_content)), seen_listings)
+
+
+def search_daft_listings(seen_listings: Set[str]) -> Tuple[List[Dict], bool]:
     """
     Search Daft.ie for rooms matching our criteria using Zyte API.
 
+    Args:
+        seen_listings: IDs already notified about, skipped while parsing and used to stop paging early
+
     Returns:
-        List of listing dictionaries
+        List of dictionaries for new listings, and whether every page the search needed was fetched and parsed
     """
     logger.info("Starting Daft.ie search with Zyte API...")
 
+    # Build search URLs, one per results page
+    urls = [
+        DAFT_SEARCH_URL.format(min_price=PRICE_MIN, max_price=PRICE_MAX, page_size=DAFT_PAGE_SIZE, offset=page * DAFT_PAGE_SIZE)
+        for page in range(DAFT_MAX_PAGES)
+    ]
+    logger.info(f"Searching: {urls[0]}")
+
+    # Fetch the first page on its own; the others are only worth a Zyte call when it comes back full
+    html_content = fetch_pages_with_zyte(urls[:1])[0]
+    if html_content is None:
+        return [], False
+
     try:
-        # Build search URL
-        url = DAFT_SEARCH_URL.format(min_price=PRICE_MIN, max_price=PRICE_MAX)
-        logger.info(f"Searching: {url}")
-
-        # Fetch page content with Zyte API
-        html_content = fetch_page_with_zyte(url)
-
-        # Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Check page title for debugging
-        page_title = soup.find('title')
-        logger.info(f"Page title: {page_title.text if page_title else 'N/A'}")
-
-        # Check if we see "no results" message
-        if "no results" in html_content.lower() or "0 results" in html_content.lower():
-            logger.info("Page explicitly states no results found")
-
-        # Find all listing cards using the correct selector
-        listing_cards = soup.select("ul[data-testid='results'] > li")
-        logger.info(f"Found {len(listing_cards)} listing cards")
-
-        results = []
-        for card in listing_cards:
-            try:
-                # Extract link - look for main listing link
-                link_elem = card.select_one("a")
-                if not link_elem:
-                    continue
-
-                link = link_elem.get('href', '')
-                if not link:
-                    continue
-
-                # Make absolute URL if needed
-                if link.startswith('/'):
-                    link = f"https://www.daft.ie{link}"
-
-                # Skip non-listing links (ads, etc.)
-                if '/for-rent/' not in link and '/sharing/' not in link and '/share/' not in link:
-                    continue
-
-                # Extract listing ID
-                listing_id = extract_listing_id(link)
-
-                # Check if listing is in allowed areas (filter out Dublin 15, etc.)
-                link_lower = link.lower()
-                address_lower = ''  # Will be set after extraction
-                is_allowed_area = False
-
-                for area in ALLOWED_AREAS:
-                    if area in link_lower:
-                        is_allowed_area = True
-                        break
-
-                # Extract title and address from card-container (need this for area check)
-                card_container = card.select_one("[data-testid='card-container']")
-                if card_container:
-                    # The card-container text contains: "TH EnquiriesCoolevally, Shankill, Dublin 18 , Shan..."
-                    # We need to extract the address part
-                    container_text = card_container.get_text(strip=True)
-                    # Remove "TH Enquiries" prefix if present
-                    container_text = container_text.replace('TH Enquiries', '').strip()
-                    title = container_text if container_text else "No title"
-                    address = title
-                else:
-                    # Fallback to headings
-                    title_elem = card.find('h2') or card.find('h3') or card.find('h1')
-                    title = title_elem.get_text(strip=True) if title_elem else "No title"
-                    address = title
-
-                # Double-check area in address text as well
-                address_lower = address.lower()
-                if not is_allowed_area:
-                    for area in ALLOWED_AREAS:
-                        if area in address_lower:
-                            is_allowed_area = True
-                            break
-
-                # Skip listings outside allowed areas
-                if not is_allowed_area:
-                    logger.debug(f"Skipping listing outside allowed areas: {address}")
-                    continue
-
-                # Extract price - different structure for sharing vs rental properties
-                price_text = 'N/A'
-
-                # Try subunit-card-container first (for rental properties)
-                subunit_elem = card.select_one("[data-testid='subunit-card-container']")
-                if subunit_elem:
-                    price_match = subunit_elem.find(string=re.compile(r'€[\d,]+'))
-                    price_text = price_match.strip() if price_match else 'N/A'
-                else:
-                    # For sharing properties, price is in card-container or as standalone element
-                    # Try to find any € sign in the card
-                    price_match = card.find(string=re.compile(r'€[\d,]+\s*per\s+\w+'))
-                    if not price_match:
-                        price_match = card.find(string=re.compile(r'€[\d,]+'))
-                    price_text = price_match.strip() if price_match else 'N/A'
+        listing_cards = select_daft_cards(html_content)
+        listing_links = daft_card_links(listing_cards)
+        results = parse_daft_cards(listing_links, seen_listings)
+    except Exception as e:
+        logger.error(f"Error parsing page {urls[0]}: {str(e)}")
+        return [], False
+
+    # Results are newest first, so if the oldest listing on page 1 was already seen, later pages hold nothing new.
+    # Only listings this bot saves count; cards outside the allowed areas are never saved, so they are passed over
+    new_ids = {listing['id'] for listing in results}
+    page_ids = [extract_listing_id(link) for _, link in listing_links]
+    oldest_id = next((listing_id for listing_id in reversed(page_ids) if listing_id in seen_listings or listing_id in new_ids), None)
+    reached_seen = oldest_id is not None and oldest_id in seen_listings
+
+    # A failed email may belong to a listing on a later page, so keep scanning them until it has gone out
+    retries = pending_retries(seen_listings)
+    if reached_seen and retries:
+        logger.info("Scanning every page to retry %d listings whose email failed", len(retries))
+        reached_seen = False
+
+    # After a run that missed pages, the listings seen on page 1 say nothing about what those pages held
+    if reached_seen and pending_rescans(seen_listings):
+        logger.info("Scanning every page, an earlier scan did not complete")
+        reached_seen = False
+
+    complete = True
+    if len(listing_cards) >= DAFT_PAGE_SIZE and not reached_seen and len(urls) > 1:
+        logger.info(f"First page is full, fetching {len(urls) - 1} more")
 
-                price = parse_price(price_text)
+        # Fetch the remaining pages with Zyte API at once, then parse them
+        pages = fetch_pages_with_zyte(urls[1:])
+        page_results, complete = parse_pages(partial(parse_daft_page, seen_listings=seen_listings), urls[1:], pages)
+        results += page_results
 
-                listing_data = {
-                    'id': listing_id,
-                    'price': price,
-                    'address': address,
-                    'title': title,
-                    'link': link
-                }
+    logger.info(f"Successfully parsed {len(results)} listings")
+    return results, complete
 
-                results.append(listing_data)
-                logger.debug(f"Parsed listing: {address} - {price}")
 
-            except Exception as e:
-                logger.warning(f"Error processing listing card: {str(e)}")
-                continue
+def parse_myhome_card(card: Tag, link: str, seen_listings: Set[str]) -> Optional[Dict]:
+    """
+    Turn one MyHome.ie property card into a listing dictionary.
 
-        logger.info(f"Successfully parsed {len(results)} listings")
-        return results
+    Args:
+        card: Property card from a MyHome.ie results page
+        link: Absolute URL the card links to, from card_links()
+        seen_listings: IDs already notified about, skipped before any field is extracted
+
+    Returns:
+        Listing dictionary, or None for seen listings, broken cards and cards outside allowed areas
+    """
+    try:
+        # Extract listing ID from URL, prefixed to avoid conflicts with Daft IDs
+        listing_id = f"myhome_{extract_listing_id(link)}"
+
+        if listing_id in seen_listings:
+            logger.debug("Skipping already seen MyHome listing %s", listing_id)
+            return None
+
+        # Extract address
+        address_elem = MYHOME_ADDRESS_SELECTOR.select_one(card)
+        if address_elem:
+            address = element_text(address_elem)
+        else:
+            address = "No address"
+
+        # Skip if not in allowed areas
+        if not in_allowed_area(link, address):
+            logger.debug("Skipping MyHome listing outside allowed areas: %s", address)
+            return None
+
+        # Extract price
+        price_match = card.find(string=_PRICE_RE)
+        price_text = price_match.strip() if price_match else 'N/A'
+        price = parse_price(price_text)
+
+        # Use address as title
+        title = address
+
+        listing_data = {
+            'id': listing_id,
+            'price': price,
+            'address': address,
+            'title': title,
+            'link': link
+        }
+
+        logger.debug("Parsed MyHome listing: %s - %s", address, price)
+        return listing_data
 
     except Exception as e:
-        logger.error(f"Error during Zyte scraping: {str(e)}")
-        return []
+        logger.warning(f"Error processing MyHome listing card: {str(e)}")
+        return None
 
 
-def search_myhome_listings() -> List[Dict]:
+def parse_myhome_page(html_content: str, seen_listings: Set[str]) -> List[Dict]:
     """
-    Search MyHome.ie for properties matching our criteria using Zyte API.
+    Parse one MyHome.ie results page.
+
+    Args:
+        html_content: HTML of the results page
+        seen_listings: IDs already notified about
 
     Returns:
-        List of listing dictionaries
+        List of dictionaries for new listings
     """
-    logger.info("Starting MyHome.ie search with Zyte API...")
-    all_results = []
+    # Parse only the property cards with BeautifulSoup
+    soup = BeautifulSoup(slice_from_marker(html_content, MYHOME_CARDS_MARKER), 'lxml', parse_only=MYHOME_CARDS_STRAINER)
 
-    for url_template in MYHOME_SEARCH_URLS:
-        try:
-            # Build search URL
-            url = url_template.format(min_price=PRICE_MIN, max_price=PRICE_MAX)
-            logger.info(f"Searching MyHome.ie: {url}")
+    # Find all property cards
+    listing_cards = MYHOME_CARD_SELECTOR.select(soup)
+    logger.info(f"Found {len(listing_cards)} MyHome.ie listing cards")
 
-            # Fetch page content with Zyte API
-            html_content = fetch_page_with_zyte(url)
+    unique_cards = card_links(listing_cards, "https://www.myhome.ie")
+    return [listing for listing in (parse_myhome_card(card, link, seen_listings) for card, link in unique_cards) if listing is not None]
 
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
 
-            # Find all property cards
-            listing_cards = soup.select('div.property-card')
-            logger.info(f"Found {len(listing_cards)} MyHome.ie listing cards")
+def search_myhome_listings(seen_listings: Set[str]) -> List[Dict]:
+    """
+    Search MyHome.ie for properties matching our criteria using Zyte API.
 
-            for card in listing_cards:
-                try:
-                    # Extract link
-                    link_elem = card.select_one('a')
-                    if not link_elem:
-                        continue
-
-                    link = link_elem.get('href', '')
-                    if not link:
-                        continue
-
-                    # Make absolute URL
-                    if link.startswith('/'):
-                        link = f"https://www.myhome.ie{link}"
-
-                    # Extract listing ID from URL
-                    listing_id = extract_listing_id(link)
-
-                    # Check if listing is in allowed areas
-                    link_lower = link.lower()
-                    is_allowed_area = False
-
-                    for area in ALLOWED_AREAS:
-                        if area in link_lower:
-                            is_allowed_area = True
-                            break
-
-                    # Extract address
-                    address_elem = card.select_one('.card-text')
-                    if address_elem:
-                        address = address_elem.get_text(strip=True)
-                    else:
-                        address = "No address"
-
-                    # Double-check area in address
-                    address_lower = address.lower()
-                    if not is_allowed_area:
-                        for area in ALLOWED_AREAS:
-                            if area in address_lower:
-                                is_allowed_area = True
-                                break
-
-                    # Skip if not in allowed areas
-                    if not is_allowed_area:
-                        logger.debug(f"Skipping MyHome listing outside allowed areas: {address}")
-                        continue
-
-                    # Extract price
-                    price_match = card.find(string=re.compile(r'€[\d,]+'))
-                    price_text = price_match.strip() if price_match else 'N/A'
-                    price = parse_price(price_text)
-
-                    # Use address as title
-                    title = address
-
-                    listing_data = {
-                        'id': f"myhome_{listing_id}",  # Prefix to avoid conflicts with Daft IDs
-                        'price': price,
-                        'address': address,
-                        'title': title,
-                        'link': link
-                    }
-
-                    all_results.append(listing_data)
-                    logger.debug(f"Parsed MyHome listing: {address} - {price}")
-
-                except Exception as e:
-                    logger.warning(f"Error processing MyHome listing card: {str(e)}")
-                    continue
+    Args:
+        seen_listings: IDs already notified about, skipped while parsing
 
-        except Exception as e:
-            logger.error(f"Error scraping MyHome.ie URL {url_template}: {str(e)}")
-            continue
+    Returns:
+        List of dictionaries for new listings
+    """
+    logger.info("Starting MyHome.ie search with Zyte API...")
 
-    logger.info(f"Successfully parsed {len(all_results)} MyHome.ie listings")
-    return all_results
+    # Build search URLs
+    urls = [url_template.format(min_price=PRICE_MIN, max_price=PRICE_MAX) for url_template in MYHOME_SEARCH_URLS]
+    for url in urls:
+        logger.info(f"Searching MyHome.ie: {url}")
+
+    # Fetch all page contents with Zyte API at once, then parse them
+    pages = fetch_pages_with_zyte(urls)
+    results, _ = parse_pages(partial(parse_myhome_page, seen_listings=seen_listings), urls, pages)
+
+    logger.info(f"Successfully parsed {len(results)} MyHome.ie listings")
+    return results
 
 
 def main():
@@ -454,49 +1114,97 @@ def main():
     # Load previously seen listings
     seen_listings = load_seen_listings()
 
-    # Search both websites
-    logger.info("\n🔍 Searching Daft.ie...")
-    daft_listings = search_daft_listings()
-
-    logger.info("\n🔍 Searching MyHome.ie...")
-    myhome_listings = search_myhome_listings()
+    # Search both websites at once; each spends most of its time waiting on Zyte renders
+    logger.info("\n🔍 Searching Daft.ie and MyHome.ie...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        daft_future = executor.submit(search_daft_listings, seen_listings)
+        myhome_future = executor.submit(search_myhome_listings, seen_listings)
+        daft_listings, daft_complete = daft_future.result()
+        myhome_listings = myhome_future.result()
 
     # Combine all listings
     all_listings = daft_listings + myhome_listings
 
-    logger.info(f"\n📊 Total listings: {len(daft_listings)} from Daft + {len(myhome_listings)} from MyHome = {len(all_listings)} total")
+    logger.info(f"\n📊 Unseen listings: {len(daft_listings)} from Daft + {len(myhome_listings)} from MyHome = {len(all_listings)} total")
+
+    # Retry markers past the window are dropped with this run's save. A Daft.ie scan that missed
+    # pages leaves one rescan marker, which keeps later runs scanning every page until one completes
+    dropped = expired_markers(seen_listings)
+    rescans = pending_rescans(seen_listings)
+    scan_entries = []
+    if daft_complete:
+        dropped |= rescans
+    elif not rescans:
+        scan_entries.append(rescan_marker())
 
     if not all_listings:
-        logger.info("No listings found matching criteria.")
+        logger.info("No new listings found matching criteria.")
+        save_listing_ids(scan_entries, dropped)
         return
 
-    # Process new listings
-    new_listings_count = 0
-    email_sent_count = 0
+    # Collect new listings with one set difference; the incoming batch is far smaller than the seen set
+    unseen_ids = {listing['id'] for listing in all_listings} - seen_listings
+    logger.debug("Skipping %d already seen or duplicate listings", len(all_listings) - len(unseen_ids))
+    new_listings = []
+    signatures = {}
+    batch_signatures = set()
+    relisted_ids = []
 
     for listing in all_listings:
         listing_id = listing['id']
 
-        if listing_id in seen_listings:
-            logger.debug(f"Skipping already seen listing: {listing_id}")
+        if listing_id not in unseen_ids:
             continue
 
-        new_listings_count += 1
+        # Take the ID out so duplicate cards are only sent once
+        unseen_ids.discard(listing_id)
+
+        # Same address and price as a listing we already sent, or one earlier in this batch
+        signature = listing_signature(listing)
+        if signature and (signature in seen_listings or signature in batch_signatures):
+            logger.info("Skipping relisted listing %s: %s - %s", listing_id, listing['address'], listing['price'])
+            relisted_ids.append(listing_id)
+            continue
+
+        if signature:
+            signatures[listing_id] = signature
+            batch_signatures.add(signature)
+
+        new_listings.append(listing)
         source = "Daft.ie" if not listing_id.startswith("myhome_") else "MyHome.ie"
-        logger.info(f"✨ New listing found [{source}]: {listing['address']} - {listing['price']}")
-
-        # Send email notification
-        if send_email_notification(listing):
-            # Only mark as seen if email was sent successfully
-            save_listing_id(listing_id)
-            seen_listings.add(listing_id)
-            email_sent_count += 1
-        else:
-            logger.warning(f"Email failed for listing {listing_id}, will retry next run")
+        logger.info("✨ New listing found [%s]: %s - %s", source, listing['address'], listing['price'])
+
+    # Send email notifications, only persisting listings as seen once their email went out
+    newly_seen_ids = scan_entries
+    notified_ids = set()
+
+    try:
+        # Relists need no email, but recording their IDs lets the next run skip them while parsing
+        newly_seen_ids.extend(relisted_ids)
+
+        if new_listings:
+            # One timestamp for the whole batch
+            sent_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            for listing_id in send_email_notifications(new_listings, sent_at):
+                notified_ids.add(listing_id)
+                newly_seen_ids.append(listing_id)
+                if listing_id in signatures:
+                    newly_seen_ids.append(signatures[listing_id])
+    finally:
+        # Unsent listings stay unseen; the marker makes the next runs fetch every Daft.ie page until they go out.
+        # One marker per listing is enough, it outlives the listing's place in the results
+        retries = pending_retries(seen_listings)
+        newly_seen_ids.extend(
+            retry_marker(listing['id']) for listing in new_listings
+            if listing['id'] not in notified_ids and listing['id'] not in retries and not listing['id'].startswith('myhome_')
+        )
+
+        # Persist in one write, even if the run dies after some emails went out
+        save_listing_ids(newly_seen_ids, dropped)
 
     # Summary
     logger.info("=" * 60)
-    logger.info(f"✅ Scan complete: {len(all_listings)} total, {new_listings_count} new, {email_sent_count} notified")
+    logger.info(f"✅ Scan complete: {len(all_listings)} unseen, {len(new_listings)} new, {len(notified_ids)} notified")
     logger.info("=" * 60)
 
 